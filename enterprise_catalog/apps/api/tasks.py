@@ -10,7 +10,7 @@ from celery.exceptions import Ignore
 from celery_utils.logged_task import LoggedTask
 from django.core.cache import cache
 from django.db import IntegrityError
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.db.utils import OperationalError
 from django_celery_results.models import TaskResult
 from requests.exceptions import ConnectionError as RequestsConnectionError
@@ -243,9 +243,9 @@ def update_full_content_metadata_task(self, force=False):  # pylint: disable=unu
             exc=RequiredTaskUnreadyError(),
         )
 
-    content_keys = [metadata.content_key for metadata in ContentMetadata.objects.filter(content_type=COURSE)]
+    content_keys = list(ContentMetadata.objects.filter(content_type=COURSE).values_list('content_key', flat=True))
     _update_full_content_metadata_course(content_keys)
-    content_keys = [metadata.content_key for metadata in ContentMetadata.objects.filter(content_type=PROGRAM)]
+    content_keys = list(ContentMetadata.objects.filter(content_type=PROGRAM).values_list('content_key', flat=True))
     _update_full_content_metadata_program(content_keys)
 
 
@@ -476,7 +476,10 @@ def index_enterprise_catalog_in_algolia_task(self, force=False):  # pylint: disa
 def get_programs_by_course():
     """ Prefetch course id -> program id mapping. """
     program_membership_by_course_key = defaultdict(set)
-    programs = ContentMetadata.objects.filter(content_type=PROGRAM).prefetch_related('associated_content_metadata')
+    # Only the content keys are read here, so leave each record's json_metadata out of both queries
+    programs = ContentMetadata.objects.filter(content_type=PROGRAM).only('content_key').prefetch_related(
+        Prefetch('associated_content_metadata', queryset=ContentMetadata.objects.only('content_key'))
+    )
     for prog in programs:
         for course in prog.associated_content_metadata.all():
             program_membership_by_course_key[course.content_key].add(prog)
@@ -576,6 +579,8 @@ def index_content_keys_in_algolia(content_keys, algolia_client):
         )
         all_memberships = ContentMetadataToQueries.objects.select_related(
             'catalog_query', 'content_metadata'
+        ).defer(
+            'content_metadata__json_metadata',
         ).filter(query).iterator()
 
         for membership in all_memberships:
@@ -1,11 +1,11 @@
 import logging
-from re import search
+import re
+from itertools import repeat
 
-from django.db import IntegrityError, models
+from django.db import IntegrityError, models, transaction
 from rest_framework import serializers, status
 
 from enterprise_catalog.apps.api.v1.utils import (
-    get_enterprise_utm_context,
     get_most_recent_modified_time,
     is_any_course_run_active,
     update_query_parameters,
@@ -22,11 +22,39 @@ from enterprise_catalog.apps.catalog.models import (
 from enterprise_catalog.apps.catalog.utils import (
     get_content_filter_hash,
     get_parent_content_key,
+    localized_utcnow,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Pulls the name of the violated unique key out of database integrity error messages
+_CATALOG_QUERY_KEY_RE = re.compile(r"(?<=for key ')(.*)(?=')")
+
+
+def _save_catalog_query_by_hash(content_filter_hash, update_existing, **fields):
+    """
+    Gets (or, with ``update_existing``, updates) the catalog query matching ``content_filter_hash``, or creates one,
+    in the manner of ``get_or_create``/``update_or_create``. The precomputed hash is passed through to
+    ``CatalogQuery.save`` so that the content filter is not hashed again on write.
+    """
+    catalog_query = CatalogQuery.objects.filter(content_filter_hash=content_filter_hash).first()
+    if catalog_query and not update_existing:
+        return catalog_query
+    catalog_query = catalog_query or CatalogQuery()
+    for field_name, value in fields.items():
+        setattr(catalog_query, field_name, value)
+    try:
+        with transaction.atomic():
+            catalog_query.save(content_filter_hash=content_filter_hash)
+    except IntegrityError:
+        # Another request may have created a catalog query with this content filter since it was looked up above
+        existing_catalog_query = CatalogQuery.objects.filter(content_filter_hash=content_filter_hash).first()
+        if update_existing or existing_catalog_query is None:
+            raise
+        return existing_catalog_query
+    return catalog_query
+
 
 def find_and_modify_catalog_query(content_filter, catalog_query_uuid=None, query_title=None):
     """
@@ -43,36 +71,42 @@ def find_and_modify_catalog_query(content_filter, catalog_query_uuid=None, query
     Returns:
         a CatalogQuery object.
     """
+    content_filter_hash = get_content_filter_hash(content_filter)
     if catalog_query_uuid:
-        catalog_query_from_uuid = CatalogQuery.get_by_uuid(uuid=catalog_query_uuid)
-        if catalog_query_from_uuid:
-            catalog_query_from_uuid.content_filter = content_filter
-            catalog_query_from_uuid.title = query_title
-            catalog_query_from_uuid.content_filter_hash = get_content_filter_hash(content_filter)
-            try:
-                catalog_query_from_uuid.save()
-            except IntegrityError as exc:
-                column = search("(?<=for key ')(.*)(?=')", str(exc))
-                logger.exception(f'Error occurred while saving catalog query: {exc}')  # pylint:disable=logging-fstring-interpolation
-                raise serializers.ValidationError(
-                    {'catalog_query': f'{column} is not unique'},
-                    code=status.HTTP_422_UNPROCESSABLE_ENTITY
-                ) from exc
-            return catalog_query_from_uuid
-        else:
-            content_filter_from_hash, _ = CatalogQuery.objects.update_or_create(
-                content_filter_hash=get_content_filter_hash(content_filter),
-                defaults={'content_filter': content_filter, 'uuid': catalog_query_uuid, 'title': query_title}
+        try:
+            # Write the new values straight to the matching row, if any, instead of loading the
+            # catalog query just to save it back.
+            updated = CatalogQuery.objects.filter(uuid=catalog_query_uuid).update(
+                content_filter=content_filter,
+                content_filter_hash=content_filter_hash,
+                title=query_title,
+                modified=localized_utcnow(),
             )
-            return content_filter_from_hash
+        except IntegrityError as exc:
+            key_match = _CATALOG_QUERY_KEY_RE.search(str(exc))
+            column = key_match.group(0) if key_match else 'catalog query'
+            logger.exception(f'Error occurred while saving catalog query: {exc}')  # pylint:disable=logging-fstring-interpolation
+            raise serializers.ValidationError(
+                {'catalog_query': f'{column} is not unique'},
+                code=status.HTTP_422_UNPROCESSABLE_ENTITY
+            ) from exc
+        if updated:
+            return CatalogQuery.get_by_uuid(uuid=catalog_query_uuid)
+        return _save_catalog_query_by_hash(
+            content_filter_hash,
+            update_existing=True,
+            content_filter=content_filter,
+            uuid=catalog_query_uuid,
+            title=query_title,
+        )
     else:
-        content_filter_from_hash, _ = CatalogQuery.objects.get_or_create(
-            content_filter_hash=get_content_filter_hash(content_filter),
-            defaults={'content_filter': content_filter, 'title': query_title}
+        return _save_catalog_query_by_hash(
+            content_filter_hash,
+            update_existing=False,
+            content_filter=content_filter,
+            title=query_title,
         )
 
-        return content_filter_from_hash
-
 
 class EnterpriseCatalogSerializer(serializers.ModelSerializer):
     """
@@ -105,6 +139,9 @@ class EnterpriseCatalogSerializer(serializers.ModelSerializer):
         ]
 
     def get_content_last_modified(self, obj):
+        # Views listing or retrieving catalogs annotate this value onto the queryset
+        if hasattr(obj, '_content_last_modified'):
+            return obj._content_last_modified  # pylint: disable=protected-access
         return obj.content_metadata.aggregate(models.Max('modified')).get('modified__max')
 
     def create(self, validated_data):
@@ -141,7 +178,16 @@ class EnterpriseCatalogSerializer(serializers.ModelSerializer):
         content_filter = validated_data.get('content_filter', default_content_filter)
         query_title = validated_data.get('query_title', default_query_title)
         catalog_query_uuid = validated_data.pop('catalog_query_uuid', default_query_uuid)
-        instance.catalog_query = find_and_modify_catalog_query(content_filter, catalog_query_uuid, query_title)
+        catalog_query = instance.catalog_query
+        catalog_query_unchanged = (
+            catalog_query is not None
+            and content_filter == catalog_query.content_filter
+            and query_title == catalog_query.title
+            and str(catalog_query_uuid) == str(catalog_query.uuid)
+        )
+        # Keep the catalog's current query when the request leaves it as is, rather than rewriting it
+        if not catalog_query_unchanged:
+            instance.catalog_query = find_and_modify_catalog_query(content_filter, catalog_query_uuid, query_title)
         return super().update(instance, validated_data)
 
 
@@ -187,54 +233,52 @@ class ContentMetadataSerializer(ImmutableStateSerializer):
         """
         enterprise_catalog = self.context['enterprise_catalog']
         content_type = instance.content_type
-        json_metadata = instance.json_metadata.copy()
+        json_metadata = instance.json_metadata
         marketing_url = json_metadata.get('marketing_url')
         content_key = json_metadata.get('key')
         parent_content_key = get_parent_content_key(json_metadata)
 
+        # Fields generated on request are collected separately and laid over the stored metadata once at the end,
+        # rather than copying the stored metadata up front and then changing it.
+        overlay = {}
+
         # The enrollment URL field of content metadata is generated on request and is determined by the status of the
         # enterprise customer as well as the catalog. So, in order to detect when content metadata has last been
         # modified, we have to also check the customer and the catalog's modified times.
         modified_time = get_most_recent_modified_time(
             instance.modified,
             enterprise_catalog.modified,
-            enterprise_catalog.enterprise_customer.last_modified_date
+            self.context['enterprise_customer_last_modified'],
         )
 
-        json_metadata['content_last_modified'] = modified_time
+        overlay['content_last_modified'] = modified_time
 
         if marketing_url:
-            marketing_url = update_query_parameters(
-                marketing_url,
-                get_enterprise_utm_context(enterprise_catalog.enterprise_name)
-            )
-            json_metadata['marketing_url'] = marketing_url
+            marketing_url = update_query_parameters(marketing_url, self.context['enterprise_utm_context'])
+            overlay['marketing_url'] = marketing_url
 
+        enrollment_url_builders = self.context['enrollment_url_builders']
         if content_type in (COURSE, COURSE_RUN):
-            json_metadata['enrollment_url'] = enterprise_catalog.get_content_enrollment_url(
-                content_resource=COURSE,
-                content_key=content_key,
-                parent_content_key=parent_content_key,
-            )
-            json_metadata['xapi_activity_id'] = enterprise_catalog.get_xapi_activity_id(
+            build_course_enrollment_url = enrollment_url_builders[COURSE]
+            overlay['enrollment_url'] = build_course_enrollment_url(content_key, parent_content_key)
+            overlay['xapi_activity_id'] = enterprise_catalog.get_xapi_activity_id(
                 content_resource=content_type,
                 content_key=content_key,
             )
             if content_type == COURSE:
                 course_runs = json_metadata.get('course_runs', [])
-                json_metadata['active'] = is_any_course_run_active(course_runs)
-                for course_run in course_runs:
-                    course_run['enrollment_url'] = enterprise_catalog.get_content_enrollment_url(
-                        content_resource=COURSE,
-                        content_key=course_run.get('key'),
-                        parent_content_key=content_key,
-                    )
+                overlay['active'] = is_any_course_run_active(course_runs)
+                if 'course_runs' in json_metadata:
+                    # Build all the course run enrollment urls from the run keys first, then pair each url with a
+                    # copy of its course run rather than adding it to the stored metadata's course runs
+                    course_run_keys = [course_run.get('key') for course_run in course_runs]
+                    enrollment_urls = map(build_course_enrollment_url, course_run_keys, repeat(content_key))
+                    overlay['course_runs'] = [
+                        {**course_run, 'enrollment_url': enrollment_url}
+                        for course_run, enrollment_url in zip(course_runs, enrollment_urls)
+                    ]
         elif content_type == PROGRAM:
             # This URL will always be blank because json_metadata['key'] doesn't exist for programs
-            json_metadata['enrollment_url'] = enterprise_catalog.get_content_enrollment_url(
-                content_resource=PROGRAM,
-                content_key=content_key,
-                parent_content_key=parent_content_key,
-            )
+            overlay['enrollment_url'] = enrollment_url_builders[PROGRAM](content_key, parent_content_key)
 
-        return json_metadata
+        return {**json_metadata, **overlay}
@@ -1,8 +1,9 @@
+from unittest import mock
 from uuid import uuid4
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.test import TestCase
-from rest_framework import serializers
+from rest_framework import serializers, status
 
 from enterprise_catalog.apps.api.v1.serializers import (
     find_and_modify_catalog_query,
@@ -72,6 +73,19 @@ class FindCatalogQueryTest(TestCase):
         result = find_and_modify_catalog_query(new_filter)
         self.assertEqual(result.content_filter, new_filter)
 
+    @mock.patch('enterprise_catalog.apps.catalog.models.get_content_filter_hash')
+    def test_created_query_reuses_content_filter_hash(self, mock_model_content_filter_hash):
+        new_filter = {'key': ['hashedonce']}
+        no_uuid_result = find_and_modify_catalog_query(new_filter)
+        new_uuid = uuid4()
+        updated_result = find_and_modify_catalog_query(new_filter, new_uuid)
+        mock_model_content_filter_hash.assert_not_called()
+        self.assertEqual(updated_result.pk, no_uuid_result.pk)
+        self.assertEqual(
+            CatalogQuery.objects.filter(pk=no_uuid_result.pk).values_list('content_filter_hash', 'uuid').get(),
+            (get_content_filter_hash(new_filter), new_uuid),
+        )
+
     def test_validation_error_raised_on_duplication(self):
         dupe_filter = {'key': ['summerxbreeze']}
         uuid_to_update = uuid4()
@@ -91,6 +105,30 @@ class FindCatalogQueryTest(TestCase):
                 uuid_to_update
             )
 
+    def test_old_uuid_updates_query_in_place(self):
+        new_filter = {'key': ['updatedinplace']}
+        new_title = 'updated in place'
+        with self.assertNumQueries(2):
+            result = find_and_modify_catalog_query(new_filter, self.old_uuid, new_title)
+        self.assertEqual(result, self.old_catalog_query)
+        self.assertEqual(result.get_deferred_fields(), set())
+        self.assertEqual((result.content_filter, result.uuid, result.title), (new_filter, self.old_uuid, new_title))
+        self.old_catalog_query.refresh_from_db()
+        self.assertEqual(self.old_catalog_query.content_filter_hash, get_content_filter_hash(new_filter))
+        self.assertGreater(self.old_catalog_query.modified, self.old_catalog_query.created)
+
+    def test_update_integrity_error_is_unprocessable(self):
+        duplicate_key_error = IntegrityError(
+            "(1062, \"Duplicate entry 'duplicate title' for key 'catalog_catalogquery.title'\")"
+        )
+        with mock.patch.object(CatalogQuery.objects, 'filter') as mock_filter:
+            mock_filter.return_value.update.side_effect = duplicate_key_error
+            with self.assertRaises(serializers.ValidationError) as context:
+                find_and_modify_catalog_query(self.old_filter, self.old_uuid, 'duplicate title')
+        error_detail = context.exception.detail['catalog_query'][0]
+        self.assertEqual(str(error_detail), 'catalog_catalogquery.title is not unique')
+        self.assertEqual(error_detail.code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
     def test_old_uuid_new_title_saves_existing_query_with_title(self):
         new_title = 'testing'
         result = find_and_modify_catalog_query(self.old_filter, self.old_uuid, new_title)
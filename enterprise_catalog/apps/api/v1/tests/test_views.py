@@ -10,6 +10,7 @@ import ddt
 import pytz
 from django.conf import settings
 from django.db import IntegrityError
+from django.db.models import Max
 from django.utils.text import slugify
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -277,6 +278,18 @@ class EnterpriseCatalogCRUDViewSetTests(APITestMixin):
             self.enterprise_catalog.publish_audit_enrollment_urls,
         )
 
+    @mock.patch('enterprise_catalog.apps.api.v1.serializers.find_and_modify_catalog_query')
+    def test_patch_unchanged_catalog_query_is_not_rewritten(self, mock_find_and_modify_catalog_query):
+        """
+        Verify patching fields other than the catalog query keeps the catalog's query without rewriting it
+        """
+        url = reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
+        response = self.client.patch(url, {'title': 'Patch title'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_find_and_modify_catalog_query.assert_not_called()
+        patched_catalog = EnterpriseCatalog.objects.get(uuid=self.enterprise_catalog.uuid)
+        self.assertEqual(patched_catalog.catalog_query, self.enterprise_catalog.catalog_query)
+
     def test_patch_unauthorized_non_catalog_admin(self):
         """
         Verify the viewset rejects patch for users that are not catalog admins
@@ -509,6 +522,43 @@ class EnterpriseCatalogCRUDViewSetListTests(APITestMixin):
         self.assertEqual(uuid.UUID(results[1]['uuid']), catalog_b.uuid)
         self.assertEqual(uuid.UUID(results[2]['uuid']), catalog_c.uuid)
 
+    def test_list_and_detail_content_last_modified(self):
+        """
+        Verify list and detail responses take each catalog's content_last_modified from the queryset annotation,
+        ignoring soft deleted content metadata mappings, instead of aggregating per catalog
+        """
+        self.set_up_superuser()
+        second_enterprise_catalog = EnterpriseCatalogFactory()
+        older_metadata = ContentMetadataFactory()
+        deleted_metadata = ContentMetadataFactory()
+        second_metadata = ContentMetadataFactory()
+        self.add_metadata_to_catalog(self.enterprise_catalog, [older_metadata, deleted_metadata])
+        self.add_metadata_to_catalog(second_enterprise_catalog, [second_metadata])
+        now = datetime.now(pytz.UTC)
+        ContentMetadata.objects.filter(pk=older_metadata.pk).update(modified=now - timedelta(days=2))
+        ContentMetadata.objects.filter(pk=deleted_metadata.pk).update(modified=now)
+        ContentMetadata.objects.filter(pk=second_metadata.pk).update(modified=now - timedelta(days=1))
+        ContentMetadataToQueries.objects.filter(content_metadata=deleted_metadata).delete()
+        expected_last_modified = [
+            catalog.content_metadata.aggregate(Max('modified')).get('modified__max')
+            for catalog in (self.enterprise_catalog, second_enterprise_catalog)
+        ]
+        self.assertEqual(expected_last_modified, [now - timedelta(days=2), now - timedelta(days=1)])
+
+        with mock.patch.object(
+            EnterpriseCatalog, 'content_metadata', new_callable=mock.PropertyMock,
+        ) as mock_content_metadata:
+            list_response = self.client.get(reverse('api:v1:enterprise-catalog-list'))
+            detail_response = self.client.get(
+                reverse('api:v1:enterprise-catalog-detail', kwargs={'uuid': self.enterprise_catalog.uuid})
+            )
+        mock_content_metadata.assert_not_called()
+        self.assertEqual(
+            [result['content_last_modified'] for result in list_response.data['results']],
+            expected_last_modified,
+        )
+        self.assertEqual(detail_response.data['content_last_modified'], expected_last_modified[0])
+
     def test_list_unauthorized_catalog_learner(self):
         """
         Verify the viewset rejects list for catalog learners
@@ -1013,19 +1063,23 @@ class EnterpriseCatalogGetContentMetadataTests(APITestMixin):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-    def test_get_content_metadata_implicit_access(self):
+    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
+    def test_get_content_metadata_implicit_access(self, mock_api_client):
         """
         Verify the get_content_metadata endpoint responds with 200 OK for
-        user with implicit JWT access
+        user with implicit JWT access, without looking up the enterprise customer for an empty catalog
         """
         self.remove_role_assignments()
         url = self._get_content_metadata_url(self.enterprise_catalog)
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_api_client.assert_not_called()
 
-    def test_get_content_metadata_no_catalog_query(self):
+    @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
+    def test_get_content_metadata_no_catalog_query(self, mock_api_client):
         """
-        Verify the get_content_metadata endpoint returns no results if the catalog has no catalog query
+        Verify the get_content_metadata endpoint returns no results if the catalog has no catalog query, without
+        looking up the enterprise customer
         """
         no_catalog_query_catalog = EnterpriseCatalogFactory(
             catalog_query=None,
@@ -1035,6 +1089,7 @@ class EnterpriseCatalogGetContentMetadataTests(APITestMixin):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.json()['results'], [])
+        mock_api_client.assert_not_called()
 
     @mock.patch('enterprise_catalog.apps.api_client.enterprise_cache.EnterpriseApiClient')
     @ddt.data(
@@ -20,7 +20,8 @@ class EnterpriseCatalogContainsContentItems(BaseViewSet, viewsets.ModelViewSet):
     """
     View to determine if an enterprise catalog contains certain content
     """
-    queryset = EnterpriseCatalog.objects.all().order_by('created')
+    # contains_content_keys reads the catalog's query (and its id) for every lookup, so join it in up front.
+    queryset = EnterpriseCatalog.objects.select_related('catalog_query').order_by('created')
     renderer_classes = [JSONRenderer, XMLRenderer]
     serializer_class = EnterpriseCatalogSerializer
     permission_required = 'catalog.has_learner_access'
@@ -1,4 +1,5 @@
 import crum
+from django.db.models import Max, Q
 from django.utils.functional import cached_property
 from rest_framework import viewsets
 from rest_framework.renderers import JSONRenderer
@@ -80,6 +81,15 @@ class EnterpriseCatalogCRUDViewSet(BaseViewSet, viewsets.ModelViewSet):
         Returns the queryset corresponding to all catalogs the requesting user has access to.
         """
         all_catalogs = EnterpriseCatalog.objects.all().order_by('created')
+        if self.request_action in ('list', 'retrieve'):
+            # Compute each catalog's ``content_last_modified`` in this query rather than with an
+            # aggregate query per catalog during serialization.
+            all_catalogs = all_catalogs.annotate(
+                _content_last_modified=Max(
+                    'catalog_query__contentmetadatatoqueries__content_metadata__modified',
+                    filter=Q(catalog_query__contentmetadatatoqueries__deleted_at__isnull=True),
+                ),
+            )
         if self.request_action == 'list':
             if not self.admin_accessible_enterprises:
                 return EnterpriseCatalog.objects.none()
@@ -13,7 +13,9 @@ from enterprise_catalog.apps.api.v1.pagination import (
     PageNumberWithSizePagination,
 )
 from enterprise_catalog.apps.api.v1.serializers import ContentMetadataSerializer
+from enterprise_catalog.apps.api.v1.utils import get_enterprise_utm_context
 from enterprise_catalog.apps.api.v1.views.base import BaseViewSet
+from enterprise_catalog.apps.catalog.constants import COURSE, PROGRAM
 from enterprise_catalog.apps.catalog.models import EnterpriseCatalog
 
 
@@ -72,6 +74,26 @@ class EnterpriseCatalogGetContentMetadata(BaseViewSet, GenericAPIView):
         response.data.move_to_end('results')  # Place the results at the end of the response again
         return response
 
+    def get_content_metadata_serializer_context(self, has_content_metadata):
+        """
+        Returns the ContentMetadataSerializer context for this catalog's content metadata.
+
+        The customer's details and the catalog and customer specific parts of marketing and enrollment urls are
+        resolved once for the whole response. They depend on the enterprise customer, which may need a call to the
+        enterprise API, so they are only resolved when there is content metadata to render with them.
+        """
+        enterprise_catalog = self.enterprise_catalog
+        context = self.get_serializer_context()
+        context['enterprise_catalog'] = enterprise_catalog
+        if has_content_metadata:
+            context['enterprise_customer_last_modified'] = enterprise_catalog.enterprise_customer.last_modified_date
+            context['enterprise_utm_context'] = get_enterprise_utm_context(enterprise_catalog.enterprise_name)
+            context['enrollment_url_builders'] = {
+                COURSE: enterprise_catalog.get_content_enrollment_url_builder(COURSE),
+                PROGRAM: enterprise_catalog.get_content_enrollment_url_builder(PROGRAM),
+            }
+        return context
+
     @action(detail=True)
     def get(self, request, **kwargs):
         """
@@ -107,17 +129,18 @@ class EnterpriseCatalogGetContentMetadata(BaseViewSet, GenericAPIView):
         provided content keys being returned.
         """
         queryset = self.filter_queryset(self.get_queryset(content_keys_filter=content_keys_filter))
-        context = self.get_serializer_context()
-        context['enterprise_catalog'] = self.enterprise_catalog
         page = self.paginate_queryset(queryset)
-
         # Traverse pagination query parameter signals that we should collect the results onto a single page
-        if page is not None and not traverse_pagination:
-            serializer = ContentMetadataSerializer(page, context=context, many=True)
+        paginate = page is not None and not traverse_pagination
+        content_metadata = page if paginate else queryset
+
+        context = self.get_content_metadata_serializer_context(has_content_metadata=bool(content_metadata))
+        serializer = ContentMetadataSerializer(content_metadata, context=context, many=True)
+
+        if paginate:
             paginated_response = self.get_paginated_response(serializer.data)
             return self.get_response_with_enterprise_fields(paginated_response)
 
-        serializer = ContentMetadataSerializer(queryset, context=context, many=True)
         ordered_data = OrderedDict({
             'previous': None,
             'next': None,
@@ -79,6 +79,13 @@ class CatalogQueryAdmin(UnchangeableMixin):
 
     form = CatalogQueryForm
 
+    def save_model(self, request, obj, form, change):
+        # The form only edits the content filter, so only write that (and its hash) to existing queries
+        obj.save(
+            content_filter_hash=form.content_filter_hash,
+            update_fields=form.changed_data if change else None,
+        )
+
 
 @admin.register(EnterpriseCatalog)
 class EnterpriseCatalogAdmin(UnchangeableMixin):
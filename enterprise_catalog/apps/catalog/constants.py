@@ -34,6 +34,9 @@ SYSTEM_ENTERPRISE_OPERATOR_ROLE = 'enterprise_openedx_operator'
 
 ACCESS_TO_ALL_ENTERPRISES_TOKEN = '*'
 
+# Change reason recorded on the historical records written while syncing content metadata from discovery
+DISCOVERY_SYNC_CHANGE_REASON = 'discovery sync'
+
 DISCOVERY_COURSE_KEY_BATCH_SIZE = 50
 DISCOVERY_PROGRAM_KEY_BATCH_SIZE = 50
 
@@ -23,27 +23,34 @@ class CatalogQueryForm(forms.ModelForm):
         model = CatalogQuery
         fields = ('content_filter',)
 
+    # Set when the content filter is cleaned so the admin can save without hashing it again.
+    content_filter_hash = None
+
     def validate_content_filter_fields(self, content_filter):
-        for key, value in cftypes.items():
-            if key in content_filter.keys():
-                if not isinstance(content_filter[key], value['type']):
-                    raise ValidationError(
-                        "Content filter '{}' must be of type {}".format(key, value['type'])
-                    )
-                if value['type'] == list:
-                    if not all(value['subtype'] == type(x) for x in content_filter[key]):
-                        raise ValidationError(
-                            "Content filter '{}' must contain values of type {}".format(
-                                key, value['subtype']
-                            )
-                        )
+        for key, field_types in cftypes.items():
+            if key not in content_filter:
+                continue
+            value = content_filter[key]
+            if not isinstance(value, field_types['type']):
+                raise ValidationError(
+                    "Content filter '{}' must be of type {}".format(key, field_types['type'])
+                )
+            # Only list fields declare a subtype; stop at the first item of the wrong type
+            subtype = field_types.get('subtype')
+            if subtype and any(subtype is not type(item) for item in value):
+                raise ValidationError(
+                    "Content filter '{}' must contain values of type {}".format(key, subtype)
+                )
 
     def clean_content_filter(self):
         content_filter = self.cleaned_data['content_filter']
         self.validate_content_filter_fields(content_filter)
 
-        content_filter_hash = get_content_filter_hash(content_filter)
-        if CatalogQuery.objects.filter(content_filter_hash=content_filter_hash).exists():
+        self.content_filter_hash = get_content_filter_hash(content_filter)
+        duplicate_catalog_queries = CatalogQuery.objects.filter(
+            content_filter_hash=self.content_filter_hash,
+        ).exclude(pk=self.instance.pk)
+        if duplicate_catalog_queries.exists():
             raise ValidationError('Catalog Query with this Content filter already exists.')
         return content_filter
 
@@ -0,0 +1,35 @@
+# Generated by Django 3.2.12 on 2026-10-15 12:00
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+# On MySQL these alterations change the columns from LONGTEXT to JSON, which rebuilds the catalog_catalogquery,
+# catalog_contentmetadata and catalog_historicalcontentmetadata tables. MySQL's JSON type also normalizes objects
+# and does not keep their key order, so stored content filters and metadata are returned with their keys sorted
+# rather than in the order they were written.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0029_contentmetadatatoqueries'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='catalogquery',
+            name='content_filter',
+            field=models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text="Query parameters which will be used to filter the discovery service's search/all endpoint results, specified as a JSON object."),
+        ),
+        migrations.AlterField(
+            model_name='contentmetadata',
+            name='json_metadata',
+            field=models.JSONField(blank=True, default={}, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text="The metadata about a particular piece content as retrieved from the discovery service's search/all endpoint results, specified as a JSON object.", null=True),
+        ),
+        migrations.AlterField(
+            model_name='historicalcontentmetadata',
+            name='json_metadata',
+            field=models.JSONField(blank=True, default={}, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text="The metadata about a particular piece content as retrieved from the discovery service's search/all endpoint results, specified as a JSON object.", null=True),
+        ),
+    ]
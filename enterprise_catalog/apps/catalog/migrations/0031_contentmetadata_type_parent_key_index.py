@@ -0,0 +1,17 @@
+# Generated by Django 3.2.12 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0030_native_jsonfield'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contentmetadata',
+            index=models.Index(fields=['content_type', 'parent_content_key'], name='catalog_cm_type_parent_key_idx'),
+        ),
+    ]
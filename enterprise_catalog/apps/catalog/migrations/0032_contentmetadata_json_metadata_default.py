@@ -0,0 +1,24 @@
+# Generated by Django 3.2.12 on 2026-10-15 12:00
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0031_contentmetadata_type_parent_key_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='contentmetadata',
+            name='json_metadata',
+            field=models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text="The metadata about a particular piece content as retrieved from the discovery service's search/all endpoint results, specified as a JSON object.", null=True),
+        ),
+        migrations.AlterField(
+            model_name='historicalcontentmetadata',
+            name='json_metadata',
+            field=models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text="The metadata about a particular piece content as retrieved from the discovery service's search/all endpoint results, specified as a JSON object.", null=True),
+        ),
+    ]
@@ -5,6 +5,7 @@ from uuid import uuid4
 
 from config_models.models import ConfigurationModel
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import IntegrityError, OperationalError, models, transaction
 from django.db.models import Q
 from django.db.models.query import QuerySet
@@ -31,6 +32,7 @@ from enterprise_catalog.apps.catalog.constants import (
     ACCESS_TO_ALL_ENTERPRISES_TOKEN,
     CONTENT_TYPE_CHOICES,
     COURSE,
+    DISCOVERY_SYNC_CHANGE_REASON,
     PROGRAM,
     json_serialized_course_modes,
 )
@@ -54,12 +56,11 @@ class CatalogQuery(TimeStampedModel):
     .. no_pii:
     """
 
-    content_filter = JSONField(
+    content_filter = models.JSONField(
         blank=False,
         null=False,
         default=dict,
-        load_kwargs={'object_pairs_hook': collections.OrderedDict},
-        dump_kwargs={'indent': 4, 'cls': JSONEncoder, 'separators': (',', ':')},
+        encoder=DjangoJSONEncoder,
         help_text=_(
             "Query parameters which will be used to filter the discovery service's search/all "
             "endpoint results, specified as a JSON object."
@@ -89,8 +90,18 @@ class CatalogQuery(TimeStampedModel):
         verbose_name_plural = _("Catalog Queries")
         app_label = 'catalog'
 
-    def save(self, *args, **kwargs):
-        self.content_filter_hash = get_content_filter_hash(self.content_filter)
+    def save(self, *args, content_filter_hash=None, **kwargs):
+        """
+        Sets ``content_filter_hash`` from the content filter before saving.
+
+        Callers that have already hashed the content filter can pass the result as ``content_filter_hash``
+        to avoid hashing it again. When ``update_fields`` is given, ``content_filter_hash`` is always
+        written along with those fields.
+        """
+        self.content_filter_hash = content_filter_hash or get_content_filter_hash(self.content_filter)
+        update_fields = kwargs.get('update_fields')
+        if update_fields:
+            kwargs['update_fields'] = {*update_fields, 'content_filter_hash'}
         super().save(*args, **kwargs)
 
     def pretty_print_content_filter(self):
@@ -293,16 +304,14 @@ class EnterpriseCatalog(TimeStampedModel):
         #   - contains programs and the specified content_keys are program ids
         query = Q(content_key__in=content_keys) | Q(parent_content_key__in=content_keys)
 
-        # retrieve content metadata objects for the specified content keys to get a set of
-        # parent content keys, i.e. course ids associated with the specified content_keys
-        # (if any) to handle the following case:
+        # match the parent content keys of the specified content_keys (if any), i.e. course
+        # ids associated with the specified content_keys, to handle the following case:
         #   - catalog contains courses and the specified content_keys are course run ids.
-        searched_metadata = ContentMetadata.objects.filter(content_key__in=content_keys)
-        parent_content_keys = {
-            metadata.parent_content_key
-            for metadata in searched_metadata
-            if metadata.parent_content_key
-        }
+        # the parent content keys are selected in a subquery so the whole check is a single query.
+        parent_content_keys = ContentMetadata.objects.filter(
+            content_key__in=content_keys,
+            parent_content_key__isnull=False,
+        ).values('parent_content_key')
         query |= Q(content_key__in=parent_content_keys)
 
         # if the filtered content metadata exists, the specified content_keys exist in the catalog
@@ -325,37 +334,61 @@ class EnterpriseCatalog(TimeStampedModel):
         """
         if not (content_key and content_resource):
             return None
+        return self.get_content_enrollment_url_builder(content_resource)(content_key, parent_content_key)
+
+    def get_content_enrollment_url_builder(self, content_resource):
+        """
+        Return a function that builds enrollment urls in this catalog for content of the given resource.
+
+        The catalog and customer specific parts of the url are resolved once, when the builder is created, so
+        callers building urls for many pieces of content only pay for the content specific parts.
+
+        Arguments:
+            content_resource (str): The content resource to use in the URL (i.e., "course", "program")
 
-        params = get_enterprise_utm_context(self.enterprise_name)
+        Returns:
+            (callable): Function taking the ``content_key`` and ``parent_content_key`` arguments described in
+                ``get_content_enrollment_url`` and returning the same url, or None if no content key is given.
+        """
+        catalog_params = get_enterprise_utm_context(self.enterprise_name)
         if self.publish_audit_enrollment_urls:
-            params['audit'] = 'true'
+            catalog_params['audit'] = 'true'
 
         if self.enterprise_customer.learner_portal_enabled and content_resource is not PROGRAM:
-            # parent_content_key is our way of telling if this is a course run
-            # since this function is never called with COURSE_RUN as content_resource
-            if parent_content_key:
-                course_key = parent_content_key
-                # adding course_run_key to the params for rendering the correct info
-                # on the LP course page and enrolling in the intended course run
-                params['course_run_key'] = content_key
-            else:
-                course_key = content_key
-            url = '{}/{}/course/{}'.format(
+            course_url_prefix = '{}/{}/course/'.format(
                 settings.ENTERPRISE_LEARNER_PORTAL_BASE_URL,
                 self.enterprise_customer.slug,
-                course_key
             )
+
+            def build_enrollment_url(content_key, parent_content_key):
+                if not content_key:
+                    return None
+                params = dict(catalog_params)
+                # parent_content_key is our way of telling if this is a course run
+                # since this function is never called with COURSE_RUN as content_resource
+                if parent_content_key:
+                    course_key = parent_content_key
+                    # adding course_run_key to the params for rendering the correct info
+                    # on the LP course page and enrolling in the intended course run
+                    params['course_run_key'] = content_key
+                else:
+                    course_key = content_key
+                return update_query_parameters(f'{course_url_prefix}{course_key}', params)
         else:
             # Catalog param only needed for legacy (non-LP) enrollment URL
-            params['catalog'] = self.uuid
-            url = '{}/enterprise/{}/{}/{}/enroll/'.format(
+            catalog_params['catalog'] = self.uuid
+            enroll_url_prefix = '{}/enterprise/{}/{}/'.format(
                 settings.LMS_BASE_URL,
                 self.enterprise_uuid,
                 content_resource,
-                content_key,
             )
 
-        return update_query_parameters(url, params)
+            def build_enrollment_url(content_key, parent_content_key):  # pylint: disable=unused-argument
+                if not content_key:
+                    return None
+                return update_query_parameters(f'{enroll_url_prefix}{content_key}/enroll/', catalog_params)
+
+        return build_enrollment_url
 
     def get_xapi_activity_id(self, content_resource, content_key):
         """
@@ -416,12 +449,11 @@ class ContentMetadata(TimeStampedModel):
     # one course can be associated with many programs and one program can contain many courses.
     associated_content_metadata = models.ManyToManyField('self')
 
-    json_metadata = JSONField(
-        default={},
+    json_metadata = models.JSONField(
+        default=dict,
         blank=True,
         null=True,
-        load_kwargs={'object_pairs_hook': collections.OrderedDict},
-        dump_kwargs={'indent': 4, 'cls': JSONEncoder, 'separators': (',', ':')},
+        encoder=DjangoJSONEncoder,
         help_text=_(
             "The metadata about a particular piece content as retrieved from the discovery service's search/all "
             "endpoint results, specified as a JSON object."
@@ -435,6 +467,10 @@ class ContentMetadata(TimeStampedModel):
         verbose_name = _("Content Metadata")
         verbose_name_plural = _("Content Metadata")
         app_label = 'catalog'
+        indexes = [
+            # Supports filtering content by type, e.g. course runs of a parent course
+            models.Index(fields=['content_type', 'parent_content_key'], name='catalog_cm_type_parent_key_idx'),
+        ]
 
     @classmethod
     def recently_modified_records(cls, time_delta):
@@ -684,8 +720,8 @@ def _update_existing_content_metadata(existing_metadata_defaults, existing_metad
 
 def _create_new_content_metadata(nonexisting_metadata_defaults):
     """
-    Creates new ContentMetadata database objects based on the defaults provided. This is done through an atomic
-    database transaction.
+    Creates new ContentMetadata database objects based on the defaults provided. This is done through a single bulk
+    insert in an atomic database transaction, along with the matching historical records.
 
     Arguments:
         nonexisting_metadata_defaults (list): List of default values for various fields to create
@@ -694,17 +730,51 @@ def _create_new_content_metadata(nonexisting_metadata_defaults):
     Returns:
         list: List of ContentMetadata objects that were created.
     """
-    metadata_list = []
+    if not nonexisting_metadata_defaults:
+        return []
+    new_metadata = [ContentMetadata(**defaults) for defaults in nonexisting_metadata_defaults]
     try:
         with transaction.atomic():
-            for defaults in nonexisting_metadata_defaults:
-                content_metadata = ContentMetadata.objects.create(**defaults)
-                metadata_list.append(content_metadata)
+            ContentMetadata.objects.bulk_create(new_metadata)
+            # MySQL does not return primary keys from bulk inserts, so read the new records back
+            metadata_list = list(ContentMetadata.objects.filter(
+                content_key__in=[metadata.content_key for metadata in new_metadata],
+            ))
+            # bulk_create does not send the post_save signal that records history, so record it here in one insert
+            ContentMetadata.history.bulk_history_create(
+                metadata_list,
+                default_change_reason=DISCOVERY_SYNC_CHANGE_REASON,
+            )
     except IntegrityError:
         LOGGER.exception('_create_new_content_metadata ran into an issue while creating new ContentMetadata objects.')
+        return []
     return metadata_list
 
 
+def _create_or_update_content_metadata_batch(batched_metadata):
+    """
+    Creates or updates a ContentMetadata object for each entry in one batch of metadata.
+
+    Arguments:
+        batched_metadata (list): List of at most 100 content metadata dictionaries.
+
+    Returns:
+        list: The list of ContentMetaData.
+    """
+    content_keys = [get_content_key(entry) for entry in batched_metadata]
+    existing_metadata = ContentMetadata.objects.filter(content_key__in=content_keys)
+    existing_metadata_by_key = {metadata.content_key: metadata for metadata in existing_metadata}
+    existing_metadata_defaults, nonexisting_metadata_defaults = _partition_content_metadata_defaults(
+        batched_metadata, existing_metadata_by_key
+    )
+
+    # Update existing ContentMetadata records
+    updated_metadata = _update_existing_content_metadata(existing_metadata_defaults, existing_metadata_by_key)
+    # Create new ContentMetadata records
+    created_metadata = _create_new_content_metadata(nonexisting_metadata_defaults)
+    return updated_metadata + created_metadata
+
+
 def create_content_metadata(metadata):
     """
     Creates or updates a ContentMetadata object.
@@ -717,21 +787,7 @@ def create_content_metadata(metadata):
     """
     metadata_list = []
     for batched_metadata in batch(metadata, batch_size=100):
-        content_keys = [get_content_key(entry) for entry in batched_metadata]
-        existing_metadata = ContentMetadata.objects.filter(content_key__in=content_keys)
-        existing_metadata_by_key = {metadata.content_key: metadata for metadata in existing_metadata}
-        existing_metadata_defaults, nonexisting_metadata_defaults = _partition_content_metadata_defaults(
-            batched_metadata, existing_metadata_by_key
-        )
-
-        # Update existing ContentMetadata records
-        updated_metadata = _update_existing_content_metadata(existing_metadata_defaults, existing_metadata_by_key)
-        metadata_list.extend(updated_metadata)
-
-        # Create new ContentMetadata records
-        created_metadata = _create_new_content_metadata(nonexisting_metadata_defaults)
-        metadata_list.extend(created_metadata)
-
+        metadata_list.extend(_create_or_update_content_metadata_batch(batched_metadata))
     return metadata_list
 
 
@@ -747,14 +803,20 @@ def associate_content_metadata_with_query(metadata, catalog_query):
     Returns:
         list: The list of content_keys for the metadata associated with the query.
     """
-    metadata_list = create_content_metadata(metadata)
+    # Work through the metadata in batches, keeping only the ids and keys of the saved
+    # ContentMetadata objects rather than every object (and its json_metadata) until the end.
+    associated_metadata_ids = []
+    associated_content_keys = []
+    for batched_metadata in batch(metadata, batch_size=100):
+        for content_metadata in _create_or_update_content_metadata_batch(batched_metadata):
+            associated_metadata_ids.append(content_metadata.id)
+            associated_content_keys.append(content_metadata.content_key)
 
     # Setting `clear=True` will remove all prior relationships between
     # the CatalogQuery's associated ContentMetadata objects
-    # before setting all new relationships from `metadata_list`.
+    # before setting all new relationships from `associated_metadata_ids`.
     # https://docs.djangoproject.com/en/2.2/ref/models/relations/#django.db.models.fields.related.RelatedManager.set
-    catalog_query.contentmetadata_set.set(metadata_list, clear=True)
-    associated_content_keys = [metadata.content_key for metadata in metadata_list]
+    catalog_query.contentmetadata_set.set(associated_metadata_ids, clear=True)
     return associated_content_keys
 
 
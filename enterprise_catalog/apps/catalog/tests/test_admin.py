@@ -0,0 +1,57 @@
+import json
+
+from django.test import TestCase
+from django.urls import reverse
+
+from enterprise_catalog.apps.catalog.models import CatalogQuery
+from enterprise_catalog.apps.catalog.tests.factories import (
+    USER_PASSWORD,
+    CatalogQueryFactory,
+    UserFactory,
+)
+
+
+class TestCatalogQueryAdmin(TestCase):
+    """
+    Tests for the CatalogQuery admin
+    """
+
+    def setUp(self):
+        super().setUp()
+        superuser = UserFactory(is_staff=True, is_superuser=True)
+        self.client.login(username=superuser.username, password=USER_PASSWORD)
+        self.existing_content_filter = {'key': ['course-v1:edX+existing']}
+        self.existing_catalog_query = CatalogQueryFactory(content_filter=self.existing_content_filter)
+
+    def _assert_duplicate_content_filter_response(self, response, submitted_content_filter):
+        """
+        Helper to assert the admin shows the submitted form again with the duplicate content filter error
+        """
+        self.assertEqual(response.status_code, 200)
+        form = response.context['adminform'].form
+        self.assertEqual(form.errors['content_filter'], ['Catalog Query with this Content filter already exists.'])
+        self.assertEqual(json.loads(form['content_filter'].value()), submitted_content_filter)
+
+    def test_add_duplicate_content_filter(self):
+        """
+        Verify adding a catalog query with an existing content filter keeps the admin's input, shows the error on the
+        content filter field and writes no catalog query
+        """
+        url = reverse('admin:catalog_catalogquery_add')
+        response = self.client.post(url, {'content_filter': json.dumps(self.existing_content_filter)})
+        self._assert_duplicate_content_filter_response(response, self.existing_content_filter)
+        self.assertEqual(list(CatalogQuery.objects.all()), [self.existing_catalog_query])
+
+    def test_change_to_duplicate_content_filter(self):
+        """
+        Verify changing a catalog query to another query's content filter keeps the admin's input, shows the error on
+        the content filter field and leaves the catalog query unchanged
+        """
+        content_filter = {'key': ['course-v1:edX+other']}
+        catalog_query = CatalogQueryFactory(content_filter=content_filter)
+        url = reverse('admin:catalog_catalogquery_change', args=[catalog_query.id])
+        response = self.client.post(url, {'content_filter': json.dumps(self.existing_content_filter)})
+        self._assert_duplicate_content_filter_response(response, self.existing_content_filter)
+        catalog_query.refresh_from_db()
+        self.assertEqual(catalog_query.content_filter, content_filter)
+        self.assertEqual(CatalogQuery.objects.count(), 2)
@@ -9,6 +9,7 @@ from django.test import TestCase, override_settings
 from enterprise_catalog.apps.catalog.constants import (
     COURSE,
     COURSE_RUN,
+    DISCOVERY_SYNC_CHANGE_REASON,
     PROGRAM,
 )
 from enterprise_catalog.apps.catalog.models import (
@@ -17,6 +18,7 @@ from enterprise_catalog.apps.catalog.models import (
     update_contentmetadata_from_discovery,
 )
 from enterprise_catalog.apps.catalog.tests import factories
+from enterprise_catalog.apps.catalog.utils import get_content_filter_hash
 
 
 class TestModels(TestCase):
@@ -128,6 +130,22 @@ class TestModels(TestCase):
         assert ContentMetadataToQueries.all_objects.all().count() == 2
         assert ContentMetadataToQueries.objects.all().count() == 1
 
+    def test_catalog_query_save_update_fields_includes_hash(self):
+        """
+        Saving a CatalogQuery with update_fields should also write the recomputed content_filter_hash,
+        without writing the other fields.
+        """
+        catalog_query = factories.CatalogQueryFactory(title='original title')
+        new_filter = {'key': ['course:updated']}
+        catalog_query.content_filter = new_filter
+        catalog_query.title = 'unsaved title'
+        catalog_query.save(update_fields=['content_filter'])
+
+        catalog_query.refresh_from_db()
+        assert catalog_query.content_filter == new_filter
+        assert catalog_query.content_filter_hash == get_content_filter_hash(new_filter)
+        assert catalog_query.title == 'original title'
+
     @override_settings(DISCOVERY_CATALOG_QUERY_CACHE_TIMEOUT=0)
     @mock.patch('enterprise_catalog.apps.api_client.discovery_cache.DiscoveryApiClient')
     def test_contentmetadata_update_from_discovery(self, mock_client):
@@ -161,6 +179,10 @@ class TestModels(TestCase):
         update_contentmetadata_from_discovery(catalog.catalog_query)
         mock_client.assert_called_once()
         self.assertEqual(ContentMetadata.objects.count(), 3)
+        self.assertEqual(
+            ContentMetadata.history.filter(history_change_reason=DISCOVERY_SYNC_CHANGE_REASON).count(),
+            3,
+        )
 
         associated_metadata = catalog.content_metadata
 